@@ -0,0 +1,49 @@
+from PyQt5.QtGui import QPixmap, QPixmapCache, QIcon, QPainter, QPen, QColor
+from PyQt5.QtCore import Qt, QSize
+
+
+DEFAULT_CACHE_LIMIT_KB = 20 * 1024
+
+_icons = {}
+
+
+def set_cache_limit(limit_kb):
+    # QPixmapCache is process-wide, so this budget is shared by every view
+    QPixmapCache.setCacheLimit(int(limit_kb))
+
+
+def cached_pixmap(path, size):
+    size = QSize(size) if isinstance(size, QSize) else QSize(size, size)
+    key = f"file:{path}:{size.width()}x{size.height()}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def cached_icon(path, size=24):
+    size = QSize(size) if isinstance(size, QSize) else QSize(size, size)
+    key = (path, size.width(), size.height())
+    icon = _icons.get(key)
+    if icon is None:
+        icon = QIcon(cached_pixmap(path, size))
+        _icons[key] = icon
+    return icon
+
+
+def box_pixmap(label, width, height):
+    key = f"box:{label}:{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(width, height)
+        pixmap.fill(QColor("lightgray"))
+        painter = QPainter(pixmap)
+        painter.setPen(QPen(Qt.black, 1))
+        painter.drawRect(0, 0, width - 1, height - 1)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, label)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
@@ -3,8 +3,8 @@ from PyQt5.QtWidgets import (
     QLineEdit, QTableWidget, QTableWidgetItem, QLabel, QFrame,
     QToolBar, QAction
 )
-from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QSize
+from icon_cache import cached_icon, set_cache_limit, DEFAULT_CACHE_LIMIT_KB
 import sys
 import random
 
@@ -20,9 +20,9 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(24, 24))
 
         # Actions
-        home_action = QAction(QIcon("home.png"), "Home", self)
-        add_action = QAction(QIcon("add.png"), "Add Asset", self)
-        delete_action = QAction(QIcon("delete.png"), "Delete Asset", self)
+        home_action = QAction(cached_icon("home.png", toolbar.iconSize()), "Home", self)
+        add_action = QAction(cached_icon("add.png", toolbar.iconSize()), "Add Asset", self)
+        delete_action = QAction(cached_icon("delete.png", toolbar.iconSize()), "Delete Asset", self)
 
         toolbar.addAction(home_action)
         toolbar.addAction(add_action)
@@ -106,6 +106,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    set_cache_limit(DEFAULT_CACHE_LIMIT_KB)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
@@ -1,46 +1,98 @@
 import sys
 import random
+from bisect import bisect_right
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QPushButton, QLabel,
-    QHBoxLayout, QVBoxLayout, QSizePolicy, QMessageBox,
-    QTableWidget, QTableWidgetItem, QMenu
+    QApplication, QMainWindow, QWidget, QLabel, QScrollArea,
+    QHBoxLayout, QVBoxLayout, QMessageBox,
+    QTableWidget, QTableWidgetItem, QMenu, QRubberBand
 )
 from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QDrag
-from PyQt5.QtCore import Qt, QMimeData, pyqtSignal
+from PyQt5.QtCore import Qt, QMimeData, QPointF, QRect, QRectF, QSize, pyqtSignal
+from icon_cache import box_pixmap, set_cache_limit, DEFAULT_CACHE_LIMIT_KB
 
 
-class DraggableBox(QPushButton):
-    def __init__(self, width_ratio, height_ratio):
+class BoxPalette(QWidget):
+    box_width = 80
+    spacing = 6
+
+    def __init__(self, boxes):
         super().__init__()
-        self.width_ratio = width_ratio
-        self.height_ratio = height_ratio
-        self.setText(f"{width_ratio:.1f}×{height_ratio:.1f}")
-        self.setFixedSize(80, int(80 * height_ratio))
-        self.setStyleSheet("background-color: lightgray; border: 1px solid black;")
-        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.boxes = boxes
+        self.drag_index = None
+        self.layout_boxes()
+
+    def layout_boxes(self):
+        # y offset of every box, so painting and hit-testing can bisect
+        # into the visible range instead of walking the whole palette
+        self.offsets = []
+        y = self.spacing
+        for _, height_ratio in self.boxes:
+            self.offsets.append(y)
+            y += int(self.box_width * height_ratio) + self.spacing
+        self.setFixedSize(self.box_width + 2 * self.spacing, y)
+        self.update()
+
+    def box_label(self, index):
+        width_ratio, height_ratio = self.boxes[index]
+        return f"{width_ratio:.1f}×{height_ratio:.1f}"
+
+    def pixmap_for(self, index):
+        _, height_ratio = self.boxes[index]
+        return box_pixmap(self.box_label(index), self.box_width, int(self.box_width * height_ratio))
+
+    def index_at(self, pos):
+        i = bisect_right(self.offsets, pos.y()) - 1
+        if i < 0:
+            return None
+        _, height_ratio = self.boxes[i]
+        x, y = self.spacing, self.offsets[i]
+        if x <= pos.x() <= x + self.box_width and pos.y() <= y + int(self.box_width * height_ratio):
+            return i
+        return None
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        first = max(bisect_right(self.offsets, rect.top()) - 1, 0)
+        for i in range(first, len(self.boxes)):
+            y = self.offsets[i]
+            if y > rect.bottom():
+                break
+            painter.drawPixmap(self.spacing, y, self.pixmap_for(i))
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_index = self.index_at(event.pos())
 
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton:
+        if event.buttons() == Qt.LeftButton and self.drag_index is not None:
+            width_ratio, height_ratio = self.boxes[self.drag_index]
             drag = QDrag(self)
             mime = QMimeData()
-            mime.setText(f"{self.width_ratio},{self.height_ratio}")
+            mime.setText(f"{width_ratio},{height_ratio}")
             drag.setMimeData(mime)
+            drag.setPixmap(self.pixmap_for(self.drag_index))
+            self.drag_index = None
             drag.exec_(Qt.CopyAction)
 
 
 class PlaceholderPanel(QWidget):
-    def __init__(self):
+    def __init__(self, box_count=6):
         super().__init__()
         self.setMinimumWidth(120)
         layout = QVBoxLayout()
         layout.addWidget(QLabel("<b>Drag Boxes</b>"))
-        layout.addStretch()
-        for _ in range(6):
-            w = random.uniform(0.2, 0.3)
-            h = random.uniform(0.5, 0.9)
-            box = DraggableBox(width_ratio=w, height_ratio=h)
-            layout.addWidget(box)
-        layout.addStretch()
+        boxes = [
+            (random.uniform(0.2, 0.3), random.uniform(0.5, 0.9))
+            for _ in range(box_count)
+        ]
+        self.box_palette = BoxPalette(boxes)
+        scroll = QScrollArea()
+        scroll.setWidget(self.box_palette)
+        scroll.setAlignment(Qt.AlignHCenter)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setFrameShape(QScrollArea.NoFrame)
+        layout.addWidget(scroll)
         self.setLayout(layout)
 
 
@@ -59,13 +111,16 @@ class ProductTableWidget(QTableWidget):
             self.selection_callback(shelf, index)
 
     def update_from_inventory(self, items):
-        self.setRowCount(0)
+        self.setUpdatesEnabled(False)
+        self.setRowCount(sum(len(boxes) for boxes in items.values()))
+        row = 0
         for shelf_index, boxes in items.items():
             for i, (x_ratio, width, height) in enumerate(boxes):
-                self.insertRow(self.rowCount())
-                self.setItem(self.rowCount() - 1, 0, QTableWidgetItem(str(shelf_index + 1)))
-                self.setItem(self.rowCount() - 1, 1, QTableWidgetItem(f"{width:.2f}×{height:.2f}"))
-                self.setItem(self.rowCount() - 1, 2, QTableWidgetItem(str(i)))
+                self.setItem(row, 0, QTableWidgetItem(str(shelf_index + 1)))
+                self.setItem(row, 1, QTableWidgetItem(f"{width:.2f}×{height:.2f}"))
+                self.setItem(row, 2, QTableWidgetItem(str(i)))
+                row += 1
+        self.setUpdatesEnabled(True)
 
 
 class BookshelfWidget(QWidget):
@@ -80,8 +135,11 @@ class BookshelfWidget(QWidget):
         self.items = self.generate_packed_shelves()
         self.hover_box = None
         self.hovered_box = None
-        self.selected_box = None
+        self.selected_boxes = set()
+        self.rubber_band = QRubberBand(QRubberBand.Rectangle, self)
+        self.rubber_band_origin = None
         self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.ClickFocus)
 
         # ✅ Ensure table is populated on startup
         self.inventory_changed.emit(self.items)
@@ -123,7 +181,7 @@ class BookshelfWidget(QWidget):
 
             if i in self.items:
                 for j, (x_ratio, width_ratio, height_ratio) in enumerate(self.items[i]):
-                    highlight = (self.hovered_box == (i, j)) or (self.selected_box == (i, j))
+                    highlight = (self.hovered_box == (i, j)) or ((i, j) in self.selected_boxes)
                     self.draw_box(painter, i, x_ratio, width_ratio, height_ratio,
                                   shelf_height, width, margin, highlight=highlight)
 
@@ -210,54 +268,169 @@ class BookshelfWidget(QWidget):
         self.update()
         event.acceptProposedAction()
 
-    def mouseMoveEvent(self, event):
-        pos = event.pos()
+    def box_rect(self, shelf_index, x_ratio, width_ratio, height_ratio):
         margin = 30
         content_width = self.width() - 2 * margin
         shelf_height = (self.height() - 2 * margin) / self.shelf_count
         usable_width = content_width * (1 - 2 * self.side_cushion_ratio)
+        x = margin + content_width * self.side_cushion_ratio + usable_width * x_ratio
+        width = usable_width * width_ratio
+        box_height = (shelf_height - 8) * height_ratio
+        y = margin + (shelf_index + 1) * shelf_height - box_height
+        return QRectF(x, y, width, box_height)
 
-        self.hovered_box = None
+    def box_at(self, pos):
+        margin = 30
+        shelf_height = (self.height() - 2 * margin) / self.shelf_count
         for shelf_index in range(self.shelf_count):
             shelf_y_top = margin + shelf_index * shelf_height
             shelf_y_bottom = shelf_y_top + shelf_height
 
             if shelf_y_top <= pos.y() <= shelf_y_bottom:
-                if shelf_index in self.items:
-                    for i, (x_ratio, width_ratio, height_ratio) in enumerate(self.items[shelf_index]):
-                        x = margin + content_width * self.side_cushion_ratio + usable_width * x_ratio
-                        width = usable_width * width_ratio
-                        box_height = (shelf_height - 8) * height_ratio
-                        y = margin + (shelf_index + 1) * shelf_height - box_height
-
-                        if x <= pos.x() <= x + width and y <= pos.y() <= y + box_height:
-                            self.hovered_box = (shelf_index, i)
-                            self.setCursor(Qt.PointingHandCursor)
-                            self.update()
-                            return
-        self.setCursor(Qt.ArrowCursor)
+                for i, (x_ratio, width_ratio, height_ratio) in enumerate(self.items.get(shelf_index, [])):
+                    if self.box_rect(shelf_index, x_ratio, width_ratio, height_ratio).contains(QPointF(pos)):
+                        return (shelf_index, i)
+                break
+        return None
+
+    def boxes_in_rect(self, rect):
+        rect = QRectF(rect)
+        return {
+            (shelf_index, i)
+            for shelf_index, boxes in self.items.items()
+            for i, (x_ratio, width_ratio, height_ratio) in enumerate(boxes)
+            if rect.intersects(self.box_rect(shelf_index, x_ratio, width_ratio, height_ratio))
+        }
+
+    def mouseMoveEvent(self, event):
+        if self.rubber_band_origin is not None:
+            self.rubber_band.setGeometry(QRect(self.rubber_band_origin, event.pos()).normalized())
+            return
+
+        self.hovered_box = self.box_at(event.pos())
+        self.setCursor(Qt.PointingHandCursor if self.hovered_box else Qt.ArrowCursor)
         self.update()
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.RightButton and self.hovered_box:
-            shelf_index, box_index = self.hovered_box
-            menu = QMenu(self)
-            remove_action = menu.addAction("Remove Box")
-            action = menu.exec_(event.globalPos())
-            if action == remove_action:
-                confirm = QMessageBox.question(
-                    self, "Confirm Removal",
-                    "Are you sure you want to remove this box?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if confirm == QMessageBox.Yes:
-                    del self.items[shelf_index][box_index]
-                    self.hovered_box = None
-                    self.inventory_changed.emit(self.items)
-                    self.update()
+        extend = bool(event.modifiers() & Qt.ShiftModifier)
+        box = self.box_at(event.pos())
+
+        if event.button() == Qt.LeftButton:
+            if box is None:
+                if not extend:
+                    self.selected_boxes = set()
+                self.rubber_band_origin = event.pos()
+                self.rubber_band.setGeometry(QRect(event.pos(), QSize()))
+                self.rubber_band.show()
+            elif extend:
+                self.selected_boxes ^= {box}
+            else:
+                self.selected_boxes = {box}
+            self.update()
+
+        elif event.button() == Qt.RightButton and box:
+            if box not in self.selected_boxes:
+                self.selected_boxes = {box}
+                self.update()
+            self.show_selection_menu(event.globalPos())
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self.rubber_band_origin is not None:
+            band = self.rubber_band.geometry()
+            self.rubber_band.hide()
+            self.rubber_band_origin = None
+            self.selected_boxes |= self.boxes_in_rect(band)
+            self.update()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Delete and self.selected_boxes:
+            self.confirm_remove_selected()
+        else:
+            super().keyPressEvent(event)
+
+    def show_selection_menu(self, global_pos):
+        count = len(self.selected_boxes)
+        menu = QMenu(self)
+        remove_action = menu.addAction("Remove Box" if count == 1 else f"Remove {count} Boxes")
+        move_menu = menu.addMenu("Move to Shelf")
+        move_actions = {
+            move_menu.addAction(f"Shelf {shelf_index + 1}"): shelf_index
+            for shelf_index in range(self.shelf_count)
+        }
+        action = menu.exec_(global_pos)
+        if action == remove_action:
+            self.confirm_remove_selected()
+        elif action in move_actions:
+            self.move_boxes(self.selected_boxes, move_actions[action])
+
+    def confirm_remove_selected(self):
+        count = len(self.selected_boxes)
+        confirm = QMessageBox.question(
+            self, "Confirm Removal",
+            "Are you sure you want to remove this box?" if count == 1
+            else f"Are you sure you want to remove these {count} boxes?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if confirm == QMessageBox.Yes:
+            self.remove_boxes(self.selected_boxes)
+
+    def remove_boxes(self, boxes):
+        # Rebuild each affected shelf once rather than deleting index by
+        # index, then notify and repaint a single time for the whole batch
+        by_shelf = {}
+        for shelf_index, box_index in boxes:
+            by_shelf.setdefault(shelf_index, set()).add(box_index)
+        for shelf_index, indices in by_shelf.items():
+            self.items[shelf_index] = [
+                box for i, box in enumerate(self.items.get(shelf_index, []))
+                if i not in indices
+            ]
+        self.commit_batch()
+
+    def move_boxes(self, boxes, target_shelf):
+        moving = sorted(box for box in boxes if box[0] != target_shelf)
+        target = self.items.setdefault(target_shelf, [])
+
+        # Free gaps on the target shelf; each box takes the first one it fits
+        padding = 0.02
+        gaps = []
+        x_cursor = 0.0
+        for start, end in sorted((x, x + w) for x, w, _ in target):
+            if start - x_cursor > 0:
+                gaps.append([x_cursor, start])
+            x_cursor = max(x_cursor, end + padding)
+        gaps.append([x_cursor, 1.0])
+
+        moved = set()
+        for shelf_index, box_index in moving:
+            _, width_ratio, height_ratio = self.items[shelf_index][box_index]
+            gap = next((g for g in gaps if g[0] + width_ratio <= g[1]), None)
+            if gap is None:
+                continue
+            x_ratio = gap[0]
+            gap[0] = x_ratio + width_ratio + padding
+            target.append((x_ratio, width_ratio, height_ratio))
+            moved.add((shelf_index, box_index))
+
+        # Boxes that did not fit stay where they are
+        if moved:
+            self.remove_boxes(moved)
+
+        unplaced = len(moving) - len(moved)
+        if unplaced:
+            QMessageBox.information(
+                self, "Move Boxes",
+                f"{unplaced} of {len(moving)} boxes did not fit on shelf {target_shelf + 1}."
+            )
+
+    def commit_batch(self):
+        self.selected_boxes = set()
+        self.hovered_box = None
+        self.inventory_changed.emit(self.items)
+        self.update()
 
     def select_box(self, shelf_index, box_index):
-        self.selected_box = (shelf_index, box_index)
+        self.selected_boxes = {(shelf_index, box_index)}
         self.update()
 
 
@@ -285,6 +458,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    set_cache_limit(DEFAULT_CACHE_LIMIT_KB)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
@@ -2,10 +2,14 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QTableWidget, QTableWidgetItem, QLabel, QFrame,
     QToolBar, QAction, QGroupBox, QTabWidget, QComboBox, QStackedWidget,
-    QPushButton, QSizePolicy
+    QPushButton, QSizePolicy, QTableView, QHeaderView, QSpinBox
 )
-from PyQt5.QtGui import QIcon, QFont, QColor
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import (
+    Qt, QSize, QEvent, QObject, QRunnable, QThreadPool, QAbstractTableModel, pyqtSignal
+)
+from collections import OrderedDict
+from icon_cache import cached_icon, set_cache_limit, DEFAULT_CACHE_LIMIT_KB
 from datetime import datetime, timedelta
 import sys
 import random
@@ -20,6 +24,124 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def calibration_color(due_cal):
+    due_date = datetime.strptime(due_cal, "%Y-%m-%d")
+    days_left = (due_date - datetime.today()).days
+
+    if days_left < 0:
+        return QColor(255, 100, 100)  # Red
+    elif days_left <= 7:
+        return QColor(255, 165, 0)    # Orange
+    return QColor(144, 238, 144)      # Light Green
+
+
+class PageFetch(QRunnable):
+    def __init__(self, source, page):
+        super().__init__()
+        self.source = source
+        self.page = page
+
+    def run(self):
+        offset = self.page * self.source.page_size
+        rows = self.source.fetch_page(offset, self.source.page_size)
+        self.source.prefetched.emit(self.page, rows)
+
+
+class PagedRowSource(QObject):
+    """Serves rows in fixed-size pages fetched on demand.
+
+    fetch_page(offset, limit) is called on the GUI thread for the page being
+    viewed and on the thread pool for its neighbours. At most max_pages pages
+    are kept; the least recently viewed are evicted first.
+    """
+    prefetched = pyqtSignal(int, list)
+
+    def __init__(self, fetch_page, total, page_size=200, max_pages=20):
+        super().__init__()
+        self.fetch_page = fetch_page
+        self.total = total
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+        self.pending = set()
+        self.current_page = None
+        self.prefetched.connect(self.store_prefetched)
+
+    def page_count(self):
+        return (self.total + self.page_size - 1) // self.page_size
+
+    def row(self, index):
+        page = index // self.page_size
+        rows = self.pages.get(page)
+        if rows is None:
+            rows = self.fetch_page(page * self.page_size, self.page_size)
+            self.store_page(page, rows)
+        else:
+            self.pages.move_to_end(page)
+
+        if page != self.current_page:
+            self.current_page = page
+            self.prefetch(page - 1)
+            self.prefetch(page + 1)
+        return rows[index - page * self.page_size]
+
+    def prefetch(self, page):
+        if 0 <= page < self.page_count() and page not in self.pages and page not in self.pending:
+            self.pending.add(page)
+            QThreadPool.globalInstance().start(PageFetch(self, page))
+
+    def store_page(self, page, rows):
+        self.pages[page] = rows
+        self.pages.move_to_end(page)
+        self.evict()
+
+    def store_prefetched(self, page, rows):
+        self.pending.discard(page)
+        if page in self.pages:
+            return
+        # Unviewed neighbours go in behind the page being viewed so they
+        # never push out pages that are actually on screen
+        self.pages[page] = rows
+        if self.current_page in self.pages:
+            self.pages.move_to_end(self.current_page)
+        self.evict()
+
+    def evict(self):
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+
+
+class CalibrationTableModel(QAbstractTableModel):
+    headers = ['Description', 'Part Number', 'Last Calibration', 'Calibration Due']
+
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+
+    def rowCount(self, parent=None):
+        return self.source.total
+
+    def columnCount(self, parent=None):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.source.row(index.row())[index.column()]
+        if role == Qt.BackgroundRole:
+            try:
+                return calibration_color(self.source.row(index.row())[3])
+            except Exception:
+                return None
+        return None
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -29,9 +151,9 @@ class MainWindow(QMainWindow):
 
         toolbar = QToolBar("Main Toolbar")
         toolbar.setIconSize(QSize(24, 24))
-        toolbar.addAction(QAction(QIcon(resource_path("home.png")), "Home", self))
-        toolbar.addAction(QAction(QIcon(resource_path("add.png")), "Add Asset", self))
-        toolbar.addAction(QAction(QIcon(resource_path("delete.png")), "Delete Asset", self))
+        toolbar.addAction(QAction(cached_icon(resource_path("home.png"), toolbar.iconSize()), "Home", self))
+        toolbar.addAction(QAction(cached_icon(resource_path("add.png"), toolbar.iconSize()), "Add Asset", self))
+        toolbar.addAction(QAction(cached_icon(resource_path("delete.png"), toolbar.iconSize()), "Delete Asset", self))
         self.addToolBar(toolbar)
 
         main_widget = QWidget()
@@ -114,13 +236,38 @@ class MainWindow(QMainWindow):
         self.assets_stack.addWidget(page0)
 
         # === Page 1: Calibration Summary ===
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
-            'Description', 'Part Number', 'Last Calibration', 'Calibration Due'
-        ])
-        self.table.cellClicked.connect(self.display_item_details)
-        self.assets_stack.addWidget(self.table)
+        page1 = QWidget()
+        page1_layout = QVBoxLayout(page1)
+        page1_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.calibration_source = PagedRowSource(
+            lambda offset, limit: self.data[offset:offset + limit], len(self.data)
+        )
+        self.calibration_model = CalibrationTableModel(self.calibration_source)
+
+        self.table = QTableView()
+        self.table.setModel(self.calibration_model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.clicked.connect(lambda index: self.display_item_details(index.row(), index.column()))
+        self.table.verticalScrollBar().valueChanged.connect(self.update_row_count_label)
+        page1_layout.addWidget(self.table)
+
+        jump_layout = QHBoxLayout()
+        self.row_count_label = QLabel()
+        self.jump_input = QSpinBox()
+        self.jump_input.setRange(1, max(self.calibration_source.total, 1))
+        jump_button = QPushButton("Go")
+        jump_button.clicked.connect(lambda: self.jump_to_row(self.jump_input.value() - 1))
+        jump_layout.addWidget(self.row_count_label)
+        jump_layout.addStretch()
+        jump_layout.addWidget(QLabel("Row:"))
+        jump_layout.addWidget(self.jump_input)
+        jump_layout.addWidget(jump_button)
+        page1_layout.addLayout(jump_layout)
+        self.table.viewport().installEventFilter(self)
+
+        self.assets_stack.addWidget(page1)
 
         assets_layout.addWidget(self.assets_stack)
 
@@ -148,6 +295,7 @@ class MainWindow(QMainWindow):
 
         sidebar_layout.addWidget(assets_group)
         self.assets_stack.currentChanged.connect(self.update_assets_title)
+        self.assets_stack.currentChanged.connect(self.update_row_count_label)
         self.update_assets_title()
 
         content = QFrame()
@@ -215,9 +363,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(sidebar)
         main_layout.addWidget(content)
 
-        self.populate_table(self.filtered_data, self.table)
-
-    from PyQt5.QtGui import QColor
+        self.update_row_count_label()
 
     def populate_table(self, data, table):
         table.setRowCount(len(data))
@@ -229,16 +375,7 @@ class MainWindow(QMainWindow):
 
             # === Apply Gradient Based on Calibration Due ===
             try:
-                due_date = datetime.strptime(due_cal, "%Y-%m-%d")
-                days_left = (due_date - datetime.today()).days
-
-                if days_left < 0:
-                    color = QColor(255, 100, 100)  # Red
-                elif days_left <= 7:
-                    color = QColor(255, 165, 0)    # Orange
-                else:
-                    color = QColor(144, 238, 144)  # Light Green
-
+                color = calibration_color(due_cal)
                 for col in range(4):
                     table.item(row, col).setBackground(color)
             except Exception as e:
@@ -264,14 +401,16 @@ class MainWindow(QMainWindow):
 
 
     def display_item_details(self, row, column):
-        current_index = self.assets_stack.currentIndex()
-        table = self.search_results_table if current_index == 0 else self.table
-        item = (
-            table.item(row, 0).text(),
-            table.item(row, 1).text(),
-            table.item(row, 2).text(),
-            table.item(row, 3).text(),
-        )
+        if self.assets_stack.currentIndex() == 0:
+            table = self.search_results_table
+            item = (
+                table.item(row, 0).text(),
+                table.item(row, 1).text(),
+                table.item(row, 2).text(),
+                table.item(row, 3).text(),
+            )
+        else:
+            item = tuple(self.calibration_source.row(row))
         desc, part, *_ = item
         serial = f"SN-{random.randint(100000, 999999)}"
         self.description_label.setText(f"Description: {desc}")
@@ -284,6 +423,27 @@ class MainWindow(QMainWindow):
             self.recently_viewed = self.recently_viewed[:20]  # Limit to 20 items
             self.populate_table(self.recently_viewed, self.recently_viewed_table)
 
+    def update_row_count_label(self):
+        total = self.calibration_source.total
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        if first < 0:
+            self.row_count_label.setText(f"{total} rows")
+            return
+        if last < 0:
+            last = total - 1
+        self.row_count_label.setText(f"Rows {first + 1}–{last + 1} of {total}")
+
+    def eventFilter(self, obj, event):
+        if obj is self.table.viewport() and event.type() == QEvent.Resize:
+            self.update_row_count_label()
+        return super().eventFilter(obj, event)
+
+    def jump_to_row(self, row):
+        index = self.calibration_model.index(row, 0)
+        self.table.scrollTo(index, QTableView.PositionAtTop)
+        self.table.selectRow(row)
+
     def update_assets_title(self):
         titles = {
             0: "Search Results / Recently Viewed",
@@ -295,6 +455,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    set_cache_limit(DEFAULT_CACHE_LIMIT_KB)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())